@@ -34,10 +34,14 @@ To Install:
 """
 
 import datetime as dt
+import json
 import os
 import re
 import xml.etree.ElementTree as et
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from itertools import chain
 
 import flame
 from PySide2 import QtCore, QtGui, QtWidgets
@@ -51,6 +55,19 @@ MESSAGE_PREFIX = '[PYTHON]'
 DEFAULT_PATH = '/opt/Autodesk/project'
 DEFAULT_PATTERN = '<project>/text/flame/<name>.ttg'
 XML = 'apply_text_timeline_fx_to_segments.xml'
+CACHE_DIR = os.path.join(
+        os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+        'apply-text-timelinefx')
+ISFILE_CACHE_SIZE = 4096
+RESOLVE_CACHE_SIZE = 4096
+STAT_THREADS = 16
+FIND_DELAY = 120  # milliseconds
+PATTERN_DELAY = 150  # milliseconds
+TOKEN_REGEX = re.compile(r'<[A-Za-z /]+>')  # anything shaped like a token
+
+# Snapshot of the PyFlame values needed for the table and tokens
+SegmentRow = namedtuple(
+        'SegmentRow', 'segment sequence_name segment_name record_in record_out')
 
 
 class FlameButton(QtWidgets.QPushButton):
@@ -845,18 +862,16 @@ class FlameTokenPushButton(QtWidgets.QPushButton):
                 background-color: rgb(71, 71, 71);
                 border: 10px solid rgb(71, 71, 71)}""")
 
-        def token_action_menu():
+        self.token_dest = token_dest
 
-            def insert_token(token):
-                for key, value in token_dict.items():
-                    if key == token:
-                        token_name = value
-                        token_dest.insert(token_name)
+        # casefold sorts aAbBcC instead of ABCabc
+        self.sorted_tokens = sorted(token_dict.items(), key=lambda v: v[0].casefold())
 
-            # the lambda sorts aAbBcC instead of ABCabc
-            for key, value in sorted(token_dict.items(), key=lambda v: v[0].upper()):
-                del value
-                token_menu.addAction(key, partial(insert_token, key))
+        def token_action_menu():
+            for key, value in self.sorted_tokens:
+                action = token_menu.addAction(key)
+                action.setData(value)
+                action.triggered.connect(self.insert_token)
 
         token_menu = QtWidgets.QMenu(self)
         token_menu.setFocusPolicy(QtCore.Qt.NoFocus)
@@ -872,38 +887,40 @@ class FlameTokenPushButton(QtWidgets.QPushButton):
         self.setMenu(token_menu)
         token_action_menu()
 
+    def insert_token(self):
+        """Insert the token stored on the menu action that was triggered."""
+        self.token_dest.insert(self.sender().data())
 
-class FlameTableWidget(QtWidgets.QTableWidget):
-    """Custom Qt Widget Flame Table Widget v1.0.0
 
-    Attributes:
-        column_headers: list of headers for the table
+class FlameTableView(QtWidgets.QTableView):
+    """Custom Qt Widget Flame Table View v1.0.0
+
+    Same look as the Flame Table Widget but displays a separate model, so large tables
+    do not need a QTableWidgetItem per cell.
 
     Usage:
-        flame_table = FlameTableWidget(['header1', 'header2'])
+        flame_table = FlameTableView()
+        flame_table.setModel(model)
     """
 
-    def __init__(self, column_headers):
+    def __init__(self):
         super().__init__()
 
         self.setMinimumSize(500, 250)
-        self.setColumnCount(len(column_headers))
-        self.setRowCount(1)
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(True)
         self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.setHorizontalHeaderLabels(column_headers)
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: rgb(33, 33, 33);
                 alternate-background-color: rgb(36, 36, 36);
                 color: rgb(190, 190, 190);
                 font: 14px 'Discreet';
                 gridline-color: rgb(33, 33, 33)}
-            QTableWidget::item {
+            QTableView::item {
                 border: 0px 10px 0px 0px;
                 padding: 0px 15px 0px 5px}
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 color: #d9d9d9;
                 background-color: #474747}
             QHeaderView::section {
@@ -912,6 +929,10 @@ class FlameTableWidget(QtWidgets.QTableWidget):
 
         self.header_horiz = self.horizontalHeader()
         self.header_horiz.setDefaultAlignment(QtCore.Qt.AlignLeft)
+        self.header_horiz.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        # Size columns to the visible rows only, not the first 1000, so resizing to
+        # contents does not resolve and stat filenames nobody is looking at
+        self.header_horiz.setResizeContentsPrecision(0)
         self.header_horiz.setStyleSheet("""
             ::section {
                 border: 0px;
@@ -921,66 +942,225 @@ class FlameTableWidget(QtWidgets.QTableWidget):
 
         self.header_vert = self.verticalHeader()
         self.header_vert.setDefaultSectionSize(24)
+        # Every row is the same height, so no per row size hints on show or resize
+        self.header_vert.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.header_vert.setVisible(False)
         self.header_vert.setStyleSheet("""
                 ::section {
                     border: 0px;
                     padding 0px}""")
 
-    def add_item(self, row, column, item):
-        """Add row if necessary, then add item to column."""
-        if row + 1 > self.rowCount():
-            self.insertRow(row)
 
-        self.setItem(row, column, QtWidgets.QTableWidgetItem(item))
+class SegmentsModel(QtCore.QAbstractTableModel):
+    """Table model holding a list of strings for each column.
 
-    def get_data_by_row_number(self, row_num):
-        """Convenience method to get data from specific row number.
+    Storing by column means a whole column, like the filenames, can be swapped out in
+    one assignment.  The filename column is computed lazily, so only the rows Qt
+    actually asks for, usually the visible ones, are resolved.
 
-        Returns:
-            A list of the data per column.
-        """
-        data = []
+    Attributes:
+        column_headers: list of headers for the table
+        columns: list containing a list of strings for each column.  Filenames not
+            resolved yet are None.
+        path: path the filenames are resolved with
+        pattern: pattern the filenames are resolved with.  Kept here rather than read
+            from the line edits, so rows drawn while typing match the rest.
+        resolve_filename: function taking a row number, path and pattern and returning
+            its filename
+        filename_exists: function taking a filename and returning True or False, or
+            None if not known yet
+    """
 
-        for column in range(self.columnCount()):
-            data.append(self.model().data(self.model().index(row_num, column)))
+    filename_column = 5
+    # ForegroundRole wants a QBrush, so one is made here rather than Qt converting a
+    # QColor every time a cell is painted
+    missing_brush = QtGui.QBrush(QtGui.QColor(190, 34, 34))
 
-        return data
+    def __init__(self, column_headers, resolve_filename, filename_exists, parent=None):
+        super().__init__(parent)
+
+        self.column_headers = column_headers
+        self.columns = [[] for _ in column_headers]
+        self.path = ''
+        self.pattern = ''
+        self.resolve_filename = resolve_filename
+        self.filename_exists = filename_exists
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Number of rows, none below the top level."""
+        if parent.isValid():
+            return 0
+
+        return len(self.columns[0]) if self.columns else 0
 
-    def get_selected_row_data(self):
-        """Convenience method to get data from selected rows.
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """Number of columns, none below the top level."""
+        if parent.isValid():
+            return 0
 
-        Returns:
-            A list containing a list for each selected row.
-        """
-        data = []
+        return len(self.column_headers)
 
-        for row in self.selectionModel().selectedRows():  # row is QModelIndex object
-            row_data = []
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Text for each cell plus red text for filenames that do not exist."""
+        if not index.isValid():
+            return None
 
-            if not self.isRowHidden(row.row()):
-                for column in range(self.columnCount()):
-                    row_data.append(
-                            self.model().data(self.model().index(row.row(), column)))
-                data.append(row_data)
+        if role == QtCore.Qt.DisplayRole:
+            if index.column() == self.filename_column:
+                return self.get_filename(index.row())
+            return self.columns[index.column()][index.row()]
+
+        if (role == QtCore.Qt.ForegroundRole and
+                index.column() == self.filename_column and
+                self.filename_exists(self.get_filename(index.row())) is False):
+            return self.missing_brush
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """Column headers.  Rows have no header."""
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.column_headers[section]
+
+        return None
+
+    def get_filename(self, row):
+        """Return the filename for a row, resolving it the first time it is needed."""
+        filename = self.columns[self.filename_column][row]
+
+        if filename is None:
+            filename = self.resolve_filename(row, self.path, self.pattern)
+            self.columns[self.filename_column][row] = filename
+
+        return filename
+
+    def get_row(self, row):
+        """Return a list of the data per column for one row."""
+        data = [column[row] for column in self.columns]
+        data[self.filename_column] = self.get_filename(row)
 
         return data
 
+    def set_columns(self, columns, path, pattern):
+        """Replace all of the data in one reset.  Filenames are left to resolve."""
+        self.beginResetModel()
+        self.columns = columns
+        self.path = path
+        self.pattern = pattern
+        self.columns[self.filename_column] = [None] * len(columns[0])
+        self.endResetModel()
+
+    def clear_filenames(self, path, pattern):
+        """Drop every resolved filename so they resolve again when next displayed."""
+        self.path = path
+        self.pattern = pattern
+        row_count = self.rowCount()
+        self.columns[self.filename_column] = [None] * row_count
+
+        if row_count:
+            self.dataChanged.emit(
+                    self.index(0, self.filename_column),
+                    self.index(row_count - 1, self.filename_column))
+
+    def refresh_missing(self):
+        """Ask the view to fetch the red text again, eg after files were checked."""
+        row_count = self.rowCount()
+
+        if row_count:
+            self.dataChanged.emit(
+                    self.index(0, self.filename_column),
+                    self.index(row_count - 1, self.filename_column),
+                    [QtCore.Qt.ForegroundRole])
+
+
+class StatWorkerSignals(QtCore.QObject):
+    """Signals for StatWorker.  QRunnable is not a QObject so cannot have its own."""
+
+    done = QtCore.Signal(dict)
+
+
+class StatWorker(QtCore.QRunnable):
+    """Check which files exist on a QThreadPool thread so the UI is not blocked.
+
+    Attributes:
+        paths: list of paths to check
+        signals: emits done with a dict of {path: exists} once every path is checked
+        cancelled: set to True to stop early without emitting done
+
+    Usage:
+        worker = StatWorker(paths)
+        worker.signals.done.connect(do_something, QtCore.Qt.QueuedConnection)
+        QtCore.QThreadPool.globalInstance().start(worker)
+    """
+
+    def __init__(self, paths):
+        super().__init__()
+
+        self.paths = paths
+        self.signals = StatWorkerSignals()
+        self.cancelled = False
+
+    @staticmethod
+    def list_files(directory):
+        """Return the names of the files in a directory, empty if it cannot be read."""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+
+    def run(self):
+        """Check each path unless cancelled, then emit all results at once."""
+        directories = {}
+
+        for path in self.paths:
+            directories.setdefault(os.path.dirname(path), []).append(path)
+
+        results = {}
+
+        for directory, paths in directories.items():
+            if self.cancelled:
+                return
+
+            if len(paths) == 1:
+                results[paths[0]] = os.path.isfile(paths[0])
+            else:
+                files = self.list_files(directory)
+
+                # Names can differ in case or normalisation from the listing on
+                # some filesystems, so a miss is stat'd rather than taken as missing
+                for path in paths:
+                    results[path] = (
+                            os.path.basename(path) in files or os.path.isfile(path))
+
+        self.signals.done.emit(results)
+
 
 class FindSegmentApplyText:
     """Find segments and load text timeline FX setups.
 
     Find specific segments in a selection, assemble a Text TimelineFX setup path using
     tokens, then load the setup to the specified segments.
+
+    Attributes:
+        cached_instance: the last FindSegmentApplyText whose window is still around.
+            Its window is hidden instead of deleted when Ok or Close is pressed, then
+            refilled and shown again by execute for the same project and user.
     """
 
+    cached_instance = None
+
     def __init__(self, selection):
         """Create FindSegmentApplyText object with starting attributes."""
-        self.selection = selection
-
         self.message(TITLE_VERSION)
         self.message(f'Script called from {__file__}')
 
+        # Read once from Flame, these do not change while the window is open
+        self.project_name = flame.project.current_project.name
+        self.user_name = flame.users.current_user.name
+
+        self.selection = selection
+
         # Load presets
         self.presets_xml = os.path.join(os.path.dirname(__file__), XML)
         self.presets_xml_tree = ''
@@ -998,12 +1178,28 @@ class FindSegmentApplyText:
         self.load_find()
 
         # Find segments
-        self.segments = []
+        self.segments = []  # SegmentRow for each segment
         self.find_segments()
 
         # Tokens
         self.now = dt.datetime.now()
         self.segment_tokens = {}
+        self.token_values = {}  # {'<token>': 'value'}
+        self.generate_static_tokens()
+        # self.segment_tokens is a dict with a nested list for each key
+        # FlameTokenPushButton wants a dict that is only {token_name: token}
+        self.token_display_dict = {
+                key: values[0] for key, values in self.segment_tokens.items()}
+        self.static_pattern = None
+        self.static_resolved = ''  # self.static_pattern with static tokens replaced
+        self.resolve_cache = OrderedDict()
+
+        # File checks
+        self.isfile_cache = OrderedDict()
+        self.isfile_cache_stale = set()  # paths loaded from disk, not yet rechecked
+        self.isfile_cache_file = os.path.join(
+                CACHE_DIR, f'{self.project_name}.json')
+        self.load_isfile_cache()
 
         # Columns
         self.table_columns = [
@@ -1021,22 +1217,55 @@ class FindSegmentApplyText:
         """Print message to shell window and append global MESSAGE_PREFIX."""
         print(' '.join([MESSAGE_PREFIX, string]))
 
-    @staticmethod
-    def get_parent_sequence(child):
-        """Returns object of the container sequence for the given flame object."""
-        parents = []
-
-        while child:
-            # a PyClip can contain segments but not be a PySequence
-            if isinstance(child, flame.PyClip):
-                break
-            if isinstance(child, flame.PySequence):
-                break
-            child = child.parent
-            parents.append(child)
-
-        parent_sequence = parents[-1]
-        return parent_sequence
+    def isfile(self, path):
+        """Cached os.path.isfile so the same setup is not stat'd on every keystroke."""
+        exists = self.isfile_cache.get(path)
+
+        if exists is None or path in self.isfile_cache_stale:
+            exists = os.path.isfile(path)
+            self.update_isfile_cache({path: exists})
+            self.isfile_cache_stale.discard(path)
+
+        return exists
+
+    def prefetch_isfile(self, paths):
+        """Stat many setups at once on a thread pool and cache the results."""
+        paths = list(dict.fromkeys(paths))
+
+        with ThreadPoolExecutor(max_workers=STAT_THREADS) as executor:
+            results = dict(zip(paths, executor.map(os.path.isfile, paths)))
+
+        self.update_isfile_cache(results)
+        self.isfile_cache_stale.difference_update(results)
+
+    def update_isfile_cache(self, results):
+        """Store {path: exists} results, dropping the oldest past the size limit."""
+        self.isfile_cache.update(results)
+
+        while len(self.isfile_cache) > ISFILE_CACHE_SIZE:
+            self.isfile_cache.popitem(last=False)
+
+    def load_isfile_cache(self):
+        """Seed the file check cache with results saved by a previous launch."""
+        try:
+            with open(self.isfile_cache_file) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return  # first launch for this project or unreadable cache
+
+        if isinstance(cache, dict):
+            self.update_isfile_cache(cache)
+            self.isfile_cache_stale.update(self.isfile_cache)
+
+    def save_isfile_cache(self):
+        """Save the file check cache so the next launch can draw the table sooner."""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+
+            with open(self.isfile_cache_file, 'w') as cache_file:
+                json.dump(self.isfile_cache, cache_file)
+        except OSError:
+            self.message(f'Could not save cache to {self.isfile_cache_file}')
 
     def load_preset_by_index_element(self, index, element):
         """Load preset and replace None with empty string."""
@@ -1084,59 +1313,136 @@ class FindSegmentApplyText:
         self.message('Scanning for segments...')
 
         for sequence in self.selection:
-            for version in sequence.versions:
-                for track in version.tracks:
-                    for segment in track.segments:
-                        # Skip hidden segments.  Would cause crash when adding TextFX.
-                        if segment.hidden.get_value() is True:
-                            continue
-                        # Skip gaps.  Clutters the segments listed in the table.
-                        if segment.type == 'Gap':
-                            continue
-                        self.segments.append(segment)
+            sequence_name = sequence.name.get_value()
+            segments = chain.from_iterable(
+                    track.segments
+                    for version in sequence.versions
+                    for track in version.tracks)
+
+            for segment in segments:
+                # Skip gaps.  Clutters the segments listed in the table.
+                # Checked first so gaps never have their hidden attribute read.
+                if segment.type == 'Gap':
+                    continue
+                # Skip hidden segments.  Would cause crash when adding TextFX.
+                if segment.hidden.get_value() is True:
+                    continue
+                self.segments.append(SegmentRow(
+                        segment, sequence_name, segment.name.get_value(),
+                        segment.record_in.timecode, segment.record_out.timecode))
 
         self.message(f'Found {len(self.segments)} segments')
 
-    def generate_segment_tokens(self, segment):
-        """Populate the token list."""
-        self.segment_tokens['am/pm'] = [
-                '<pp>', self.now.strftime('%p').lower()]
-        self.segment_tokens['AM/PM'] = [
-                '<PP>', self.now.strftime('%p').upper()]
-        self.segment_tokens['Day'] = [
-                '<DD>', self.now.strftime('%d')]
-        self.segment_tokens['Hour (12hr)'] = [
-                '<hh>', self.now.strftime('%I')]
-        self.segment_tokens['Hour (24hr)'] = [
-                '<HH>', self.now.strftime('%H')]
-        self.segment_tokens['Minute'] = [
-                '<mm>', self.now.strftime('%M')]
-        self.segment_tokens['Month'] = [
-                '<MM>', self.now.strftime('%m')]
-        self.segment_tokens['Project'] = [
-                '<project>', flame.project.current_project.name]
-        self.segment_tokens['Segment Name'] = [
-                '<segment name>', segment.name.get_value()]
-        self.segment_tokens['Sequence Name'] = [
-                '<name>', self.get_parent_sequence(segment).name.get_value()]
-        self.segment_tokens['User'] = [
-                '<user>', flame.users.current_user.name]
-        self.segment_tokens['Year'] = [
-                '<YYYY>', self.now.strftime('%Y')]
-
-    def resolve_tokens(self):
-        """Replace tokens with values."""
-        result = self.pattern
+    def reuse_window(self, selection):
+        """Refill the window left from a previous call with a new selection."""
+        self.message('Reusing window from previous call')
+
+        self.selection = selection
+        self.segments = []
+        self.find_segments()
+
+        self.now = dt.datetime.now()
+        self.generate_static_tokens()
+        self.static_pattern = None
+        self.resolve_cache.clear()
+        self.isfile_cache_stale.update(self.isfile_cache)
+
+        # Fields
+        self.find_timer.stop()
+        self.pattern_timer.stop()
+        self.load_path()
+        self.load_pattern()
+        self.load_find()
+
+        # The table is refilled below, so the line edits do not need to refresh it
+        for line_edit, text in ((self.path_line_edit, self.path),
+                                (self.pattern_line_edit, self.pattern),
+                                (self.find_line_edit, self.find)):
+            line_edit.blockSignals(True)
+            line_edit.setText(text)
+            line_edit.blockSignals(False)
 
-        for token, values in self.segment_tokens.items():
-            del token
-            result = re.sub(values[0], values[1], result)
+        presets = self.presets_xml_root.findall('preset')
+        self.btn_preset.setText(presets[0].get('name') if presets else '')
+        self.btn_find_segment.setChecked(bool(self.find))
+        self.find_line_edit.setEnabled(bool(self.find))
+
+        self.populate_table()
+        self.segments_proxy.setFilterFixedString(self.find)
+
+        self.window.show()
+        self.window.raise_()
+        self.window.activateWindow()
+        self.resize_filename_column()
+
+    def clear_selection(self):
+        """Let go of the selected Flame objects while the window is hidden."""
+        self.selection = []
+        self.segments = []
+        self.populate_table()
+
+    def generate_static_tokens(self):
+        """Populate the token list with the values shared by every segment."""
+        am_pm, day, hour_12, hour_24, minute, month, year = self.now.strftime(
+                '%p|%d|%I|%H|%M|%m|%Y').split('|')
+
+        self.segment_tokens['am/pm'] = ['<pp>', am_pm.lower()]
+        self.segment_tokens['AM/PM'] = ['<PP>', am_pm.upper()]
+        self.segment_tokens['Day'] = ['<DD>', day]
+        self.segment_tokens['Hour (12hr)'] = ['<hh>', hour_12]
+        self.segment_tokens['Hour (24hr)'] = ['<HH>', hour_24]
+        self.segment_tokens['Minute'] = ['<mm>', minute]
+        self.segment_tokens['Month'] = ['<MM>', month]
+        self.segment_tokens['Project'] = ['<project>', self.project_name]
+        self.segment_tokens['Segment Name'] = ['<segment name>', '']
+        self.segment_tokens['Sequence Name'] = ['<name>', '']
+        self.segment_tokens['User'] = ['<user>', self.user_name]
+        self.segment_tokens['Year'] = ['<YYYY>', year]
+
+        self.token_values = dict(self.segment_tokens.values())
+        self.static_token_values = {
+                token: value for token, value in self.token_values.items()
+                if token not in ('<segment name>', '<name>')}
+
+    def generate_segment_tokens(self, segment_row):
+        """Update the tokens that depend on the segment."""
+        self.segment_tokens['Segment Name'][1] = segment_row.segment_name
+        self.segment_tokens['Sequence Name'][1] = segment_row.sequence_name
+
+        self.token_values['<segment name>'] = self.segment_tokens['Segment Name'][1]
+        self.token_values['<name>'] = self.segment_tokens['Sequence Name'][1]
+
+    def resolve_tokens(self, pattern):
+        """Replace tokens with values."""
+        # Nothing to replace, eg while typing the directory part of the pattern
+        if '<' not in pattern:
+            return pattern
+
+        if pattern != self.static_pattern:
+            self.static_pattern = pattern
+            self.static_resolved = TOKEN_REGEX.sub(
+                    lambda match: self.static_token_values.get(
+                        match.group(0), match.group(0)),
+                    pattern)
+
+        key = (pattern, self.token_values['<name>'],
+               self.token_values['<segment name>'])
+        result = self.resolve_cache.get(key)
+
+        if result is None:
+            result = self.static_resolved.replace(
+                    '<segment name>', self.token_values['<segment name>'])
+            result = result.replace('<name>', self.token_values['<name>'])
+            self.resolve_cache[key] = result
+
+            if len(self.resolve_cache) > RESOLVE_CACHE_SIZE:
+                self.resolve_cache.popitem(last=False)
 
         return result
 
-    def assemble_filename(self):
+    def assemble_filename(self, path, pattern):
         """Assemble finished filename for row in the Table."""
-        return os.path.join(self.path, self.resolve_tokens())
+        return os.path.join(path, self.resolve_tokens(pattern))
 
     def apply_text_fx_to_segment(self, segment, text_setup):
         """Apply Text TimelineFX to segment, then load setup."""
@@ -1148,7 +1454,7 @@ class FindSegmentApplyText:
 
         self.message(f'Loading {text_setup}')
 
-        if os.path.isfile(text_setup):
+        if self.isfile(text_setup):
             try:
                 # load_setup will not take utf-8, only ascii
                 segment_text_fx.load_setup(text_setup.encode('ascii', 'ignore'))
@@ -1159,6 +1465,27 @@ class FindSegmentApplyText:
         else:
             self.message('File does not exist!')
 
+    def populate_table(self):
+        """Fill in the table."""
+        self.segments_model.set_columns([
+                [str(count).zfill(4) for count in range(1, len(self.segments) + 1)],
+                [segment_row.sequence_name for segment_row in self.segments],
+                [segment_row.segment_name for segment_row in self.segments],
+                [segment_row.record_in for segment_row in self.segments],
+                [segment_row.record_out for segment_row in self.segments],
+                []],
+                self.path, self.pattern)
+
+        # The filename column is left to resize_filename_column once the view is shown
+        for column in range(SegmentsModel.filename_column):
+            self.segments_table.resizeColumnToContents(column)
+
+    def resize_filename_column(self):
+        """Size the filename column to its contents, only while the table is shown."""
+        # A hidden view measures every row, which would resolve every filename
+        if self.segments_table.isVisible():
+            self.segments_table.resizeColumnToContents(SegmentsModel.filename_column)
+
     def save_preset_window(self):
         """Smaller window with save dialog."""
 
@@ -1364,15 +1691,26 @@ class FindSegmentApplyText:
             self.save_preset_window()
 
         def okay_button():
-            """Close window and process the artist's selected selection."""
-            self.window.close()
+            """Hide window and process the artist's selected selection."""
+            self.window.hide()
+
+            # Apply any refresh still waiting on the typing delay or a closing >
+            if self.find_timer.isActive():
+                self.find_timer.stop()
+                filter_table()
+            if self.pattern_timer.isActive() or not pattern_is_complete():
+                self.pattern_timer.stop()
+                refresh_filename_column()
 
-            row_data = self.segments_table.get_selected_row_data()
+            row_data = get_selected_row_data()
+
+            # Check every setup up front so the loop below only waits on Flame
+            self.prefetch_isfile(row[5] for row in row_data)
 
             self.progress_window = FlameProgressWindow(
                     'Progress', len(row_data))
 
-            for row in row_data:
+            for count, row in enumerate(row_data, start=1):
                 if self.progress_window.cancelled:
                     break
 
@@ -1381,10 +1719,10 @@ class FindSegmentApplyText:
                 self.progress_window.set_text(
                         f'Apply Text TimlineFX to {row[2]} in {row[1]} at {row[3]}')
 
-                self.apply_text_fx_to_segment(self.segments[int(row[0]) - 1], row[5])
+                self.apply_text_fx_to_segment(
+                        self.segments[int(row[0]) - 1].segment, row[5])
 
-                self.progress_window.set_progress_value(
-                        row_data.index(row) + 1)
+                self.progress_window.set_progress_value(count)
 
             self.progress_window.close()
 
@@ -1393,51 +1731,109 @@ class FindSegmentApplyText:
             else:
                 self.message('Done!')
 
+            self.save_isfile_cache()
+            self.clear_selection()
+
         def close_button():
-            """Close the window."""
-            self.window.close()
+            """Hide the window so the next call can show it again."""
+            self.window.hide()
             self.message('Window closed!')
+            self.save_isfile_cache()
+            self.clear_selection()
+
+        def get_selected_row_data():
+            """Get data from the selected rows that are not filtered out.
+
+            Returns:
+                A list containing a list for each selected row.
+            """
+            selected = self.segments_table.selectionModel().selectedRows()
+
+            return [
+                self.segments_model.get_row(
+                    self.segments_proxy.mapToSource(index).row())
+                for index in selected]
 
         def filter_table():
             """Updates the table when anything is typed in the Find bar."""
-            for num in range(self.segments_table.rowCount()):
-                if self.find in self.segments_table.get_data_by_row_number(num)[2]:
-                    self.segments_table.showRow(num)
-                else:
-                    self.segments_table.hideRow(num)
-
-        def update_filename_column():
-            """Update the filename column when the filename line edit is changed."""
-            for count, segment in enumerate(self.segments):
-                self.generate_segment_tokens(segment)
-                self.segments_table.add_item(count, 5, self.assemble_filename())
-
-        def verify_filename_column_exists():
-            """Check if filename for text setup exists, if not, color cell text red."""
-            for row in range(self.segments_table.rowCount()):
-                if not os.path.isfile(
-                        self.segments_table.get_data_by_row_number(row)[5]):
-                    self.segments_table.item(row, 5).setData(
-                            QtCore.Qt.ForegroundRole, QtGui.QColor(190, 34, 34))
+            self.segments_proxy.setFilterFixedString(self.find)
+
+        def resolve_filename(row, path, pattern):
+            """Assemble the filename for one row of the table."""
+            self.generate_segment_tokens(self.segments[row])
+            return self.assemble_filename(path, pattern)
+
+        def filename_exists(filename):
+            """Cached result of whether the filename exists, None if not known yet."""
+            exists = self.isfile_cache.get(filename)
+
+            if ((exists is None or filename in self.isfile_cache_stale) and
+                    filename not in self.files_checking):
+                self.files_checking.add(filename)
+                self.files_to_check.append(filename)
+                self.check_timer.start()
+
+            return exists
+
+        def check_files():
+            """Stat the queued filenames in the background."""
+            worker = StatWorker(self.files_to_check)
+            self.files_to_check = []
+            self.stat_workers.append(worker)
+            worker.signals.done.connect(
+                    partial(files_checked, worker), QtCore.Qt.QueuedConnection)
+            QtCore.QThreadPool.globalInstance().start(worker)
+
+        def cancel_file_checks():
+            """Stop checking filenames that belong to a previous pattern or path."""
+            for worker in self.stat_workers:
+                worker.cancelled = True
+
+            self.stat_workers = []
+            self.files_checking.clear()
+            self.files_to_check = []
+            self.check_timer.stop()
+
+        def files_checked(worker, results):
+            """Update the cache and red text with fresh results."""
+            if worker in self.stat_workers:
+                self.stat_workers.remove(worker)
+
+            self.update_isfile_cache(results)
+            self.isfile_cache_stale.difference_update(results)
+            self.files_checking.difference_update(results)
+            self.segments_model.refresh_missing()
 
         def find_changed():
             """Everything to refresh when the find line edit is changed."""
             self.find = self.find_line_edit.text()
-            filter_table()
+            self.find_timer.start()
 
         def path_changed():
             """Everything to refresh when the path line edit is changed."""
             self.path = self.path_line_edit.text()
-            update_filename_column()
-            self.segments_table.resizeColumnsToContents()
-            verify_filename_column_exists()
+            refresh_filename_column()
 
         def pattern_changed():
             """Everything to refresh when the pattern line edit is changed."""
             self.pattern = self.pattern_line_edit.text()
-            update_filename_column()
-            self.segments_table.resizeColumnsToContents()
-            verify_filename_column_exists()
+
+            if pattern_is_complete():
+                self.pattern_timer.start()
+            else:
+                self.pattern_timer.stop()
+
+        def pattern_is_complete():
+            """False while a token is still being typed, like <pro without the >."""
+            return self.pattern.count('<') == self.pattern.count('>')
+
+        def refresh_filename_column():
+            """Rebuild and verify the filename column."""
+            cancel_file_checks()
+            # Setups may have been saved since they were checked
+            self.isfile_cache_stale.update(self.isfile_cache)
+            self.segments_model.clear_filenames(self.path, self.pattern)
+            self.resize_filename_column()
 
         def find_toggle():
             """Toggle UI elements based on find."""
@@ -1458,25 +1854,12 @@ class FindSegmentApplyText:
                 self.find_line_edit.setEnabled(False)
             filter_table()
 
-        def populate_table():
-            """Fill in the table."""
-            for count, segment in enumerate(self.segments):
-                self.generate_segment_tokens(segment)
-                self.segments_table.add_item(
-                        count, 0, str(count + 1).zfill(4))
-                self.segments_table.add_item(
-                        count, 1, self.get_parent_sequence(segment).name.get_value())
-                self.segments_table.add_item(
-                        count, 2, segment.name.get_value())
-                self.segments_table.add_item(
-                        count, 3, segment.record_in.timecode)
-                self.segments_table.add_item(
-                        count, 4, segment.record_out.timecode)
-                self.segments_table.add_item(
-                        count, 5, self.assemble_filename())
-
-            verify_filename_column_exists()
-            self.segments_table.resizeColumnsToContents()
+        def window_destroyed():
+            """Forget the window once Qt deletes it, eg closed from the title bar."""
+            self.save_isfile_cache()
+
+            if FindSegmentApplyText.cached_instance is self:
+                FindSegmentApplyText.cached_instance = None
 
         self.window = QtWidgets.QWidget()
 
@@ -1486,6 +1869,7 @@ class FindSegmentApplyText:
 
         # Mac needs this to close the window
         self.window.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.window.destroyed.connect(window_destroyed)
 
         # FlameLineEdit class needs this
         self.window.setFocusPolicy(QtCore.Qt.StrongFocus)
@@ -1502,6 +1886,29 @@ class FindSegmentApplyText:
         self.path_label = FlameLabel('Path')
         self.pattern_label = FlameLabel('Pattern')
 
+        # Background file checks
+        self.stat_workers = []
+        self.files_checking = set()  # queued or being checked by a StatWorker
+        self.files_to_check = []  # queued for the next StatWorker
+
+        # Runs once control returns to the event loop, so every filename the view
+        # asks about while painting goes to a single StatWorker
+        self.check_timer = QtCore.QTimer(self.window)
+        self.check_timer.setSingleShot(True)
+        self.check_timer.setInterval(0)
+        self.check_timer.timeout.connect(check_files)
+
+        # Timers
+        self.find_timer = QtCore.QTimer(self.window)
+        self.find_timer.setSingleShot(True)
+        self.find_timer.setInterval(FIND_DELAY)
+        self.find_timer.timeout.connect(filter_table)
+
+        self.pattern_timer = QtCore.QTimer(self.window)
+        self.pattern_timer.setSingleShot(True)
+        self.pattern_timer.setInterval(PATTERN_DELAY)
+        self.pattern_timer.timeout.connect(refresh_filename_column)
+
         # Line Edit
         self.path_line_edit = FlameLineEditFileBrowse(self.path, 'dir', self.window)
         self.path_line_edit.textChanged.connect(path_changed)
@@ -1513,9 +1920,20 @@ class FindSegmentApplyText:
         self.find_line_edit.textChanged.connect(find_changed)
 
         # Table
-        self.segments_table = FlameTableWidget(self.table_columns)
+        # Models are not parented to the window so a background file check that
+        # finishes after the window is closed still has a model to update
+        self.segments_model = SegmentsModel(
+                self.table_columns, resolve_filename, filename_exists)
+
+        self.segments_proxy = QtCore.QSortFilterProxyModel()
+        self.segments_proxy.setSourceModel(self.segments_model)
+        self.segments_proxy.setFilterKeyColumn(2)
+        self.segments_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+
+        self.segments_table = FlameTableView()
+        self.segments_table.setModel(self.segments_proxy)
         self.segments_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        populate_table()
+        self.populate_table()
         filter_table()
 
         # Buttons
@@ -1528,12 +1946,7 @@ class FindSegmentApplyText:
             'Delete', preset_delete_button, button_width=110)
 
         self.tokens_btn = FlameTokenPushButton(
-            'Add Token',
-            # self.segment_tokens is a dict with a nested set for each key
-            # FlameTokenPushButton wants a dict that is only {token_name: token}
-            # so need to simplify it with a dict comprehension
-            {key: values[0] for key, values in self.segment_tokens.items()},
-            self.pattern_line_edit)
+            'Add Token', self.token_display_dict, self.pattern_line_edit)
 
         self.btn_find_segment = FlamePushButton(
             'Find Segment', self.window, bool(self.find), find_segment_button)
@@ -1546,9 +1959,12 @@ class FindSegmentApplyText:
         find_toggle()
 
         # Layout
+        # A single grid instead of nested box layouts, so Qt solves one layout
         self.grid = QtWidgets.QGridLayout()
+        self.grid.setContentsMargins(20, 20, 20, 20)
         self.grid.setHorizontalSpacing(10)
         self.grid.setVerticalSpacing(10)
+        self.grid.setColumnStretch(1, 1)
 
         self.grid.addWidget(self.preset_label, 0, 0)
         self.grid.addWidget(self.btn_preset, 0, 1)
@@ -1561,39 +1977,53 @@ class FindSegmentApplyText:
         self.grid.addWidget(self.tokens_btn, 2, 2)
         self.grid.addWidget(self.btn_find_segment, 3, 0)
         self.grid.addWidget(self.find_line_edit, 3, 1)
+        self.grid.setRowMinimumHeight(4, 20)
+        self.grid.addWidget(self.segments_table, 5, 0, 1, 4)
+        self.grid.setRowStretch(5, 1)
+        self.grid.setRowMinimumHeight(6, 20)
+        self.grid.addWidget(self.cancel_btn, 7, 1, QtCore.Qt.AlignRight)
+        self.grid.addWidget(self.ok_btn, 7, 2, 1, 2, QtCore.Qt.AlignRight)
 
-        self.hbox = QtWidgets.QHBoxLayout()
-        self.hbox.addWidget(self.segments_table)
-
-        self.hbox2 = QtWidgets.QHBoxLayout()
-        self.hbox2.addStretch(1)
-        self.hbox2.addWidget(self.cancel_btn)
-        self.hbox2.addWidget(self.ok_btn)
-
-        self.vbox = QtWidgets.QVBoxLayout()
-        self.vbox.setMargin(20)
-        self.vbox.addLayout(self.grid)
-        self.vbox.insertSpacing(1, 20)
-        self.vbox.addLayout(self.hbox)
-        self.vbox.insertSpacing(3, 20)
-        self.vbox.addLayout(self.hbox2)
+        self.window.setLayout(self.grid)
 
-        self.window.setLayout(self.vbox)
+        FindSegmentApplyText.cached_instance = self
 
         self.window.show()
+        self.resize_filename_column()
         return self.window
 
 
 def scope_timeline(selection):
     """Filter for only PyClips."""
-    return any(isinstance(item, flame.PyClip) for item in selection)
+    py_clip = flame.PyClip
+    return any(isinstance(item, py_clip) for item in selection)
+
+
+def execute(selection):
+    """Show the window from a previous call again or build a new one."""
+    cached = FindSegmentApplyText.cached_instance
+
+    if cached is not None:
+        if (cached.project_name == flame.project.current_project.name and
+                cached.user_name == flame.users.current_user.name):
+            cached.reuse_window(selection)
+            return
+
+        # Different project or user, so the hidden window is deleted, not reused
+        cached.window.close()
+
+    FindSegmentApplyText(selection)
+
+
+# Built once since Flame asks for the menu every time the media panel is refreshed
+MEDIA_PANEL_ACTIONS = [{'name': 'Apply...',
+                        'actions': [{'name': 'Text TimelineFX to Segments',
+                                     'isVisible': scope_timeline,
+                                     'execute': execute,
+                                     'minimumVersion': '2022'}]
+                       }]
 
 
 def get_media_panel_custom_ui_actions():
     """Python hook to add custom right click menu."""
-    return [{'name': 'Apply...',
-             'actions': [{'name': 'Text TimelineFX to Segments',
-                          'isVisible': scope_timeline,
-                          'execute': FindSegmentApplyText,
-                          'minimumVersion': '2022'}]
-            }]
+    return MEDIA_PANEL_ACTIONS